@@ -0,0 +1,50 @@
+import cluster from 'node:cluster'
+import dotenv from 'dotenv'
+
+dotenv.config()
+
+// Entry point for running the API as several processes sharing one port.
+// The primary only supervises workers; it never loads the app, so it opens no
+// MongoDB connections. Workers share state only through MongoDB (sessions,
+// users, TTS cache), so any of them can serve any request.
+const workerCount = Number.parseInt(process.env.WEB_CONCURRENCY || '1', 10) || 1
+
+// A worker that dies this soon after starting is treated as failing on boot
+// (EADDRINUSE, bad env, ...). Restarts back off and stop after repeated failures.
+const MIN_HEALTHY_UPTIME_MS = 10_000
+const MAX_RAPID_FAILURES = 5
+const MAX_RESTART_DELAY_MS = 30_000
+
+if (cluster.isPrimary && workerCount > 1) {
+  const startedAt = new Map()
+  let rapidFailures = 0
+
+  const fork = () => {
+    const worker = cluster.fork()
+    startedAt.set(worker.id, Date.now())
+  }
+
+  console.log(`Starting ${workerCount} StudyHub API workers`)
+  for (let i = 0; i < workerCount; i++) {
+    fork()
+  }
+
+  cluster.on('exit', (worker, code, signal) => {
+    const uptime = Date.now() - startedAt.get(worker.id)
+    startedAt.delete(worker.id)
+
+    if (worker.exitedAfterDisconnect) return
+
+    rapidFailures = uptime < MIN_HEALTHY_UPTIME_MS ? rapidFailures + 1 : 0
+    if (rapidFailures > MAX_RAPID_FAILURES) {
+      console.error(`Workers keep exiting right after start (last: ${signal || code}), giving up`)
+      process.exit(1)
+    }
+
+    const delay = Math.min(1000 * 2 ** rapidFailures, MAX_RESTART_DELAY_MS)
+    console.warn(`Worker ${worker.process.pid} exited (${signal || code}), restarting in ${delay}ms`)
+    setTimeout(fork, delay)
+  })
+} else {
+  await import('./index.js')
+}
@@ -8,20 +8,35 @@ const DB_NAME = 'studyhub'
 
 let client = null
 let db = null
+let connecting = null
 
 export async function connectDB() {
   if (db) return db
 
-  try {
-    client = new MongoClient(MONGODB_URI)
-    await client.connect()
-    db = client.db(DB_NAME)
-    console.log('✅ Connected to MongoDB')
-    return db
-  } catch (err) {
-    console.error('❌ MongoDB connection error:', err)
-    throw err
+  // Share one in-flight connection attempt so concurrent callers reuse a single
+  // client and connection pool instead of each opening their own
+  if (!connecting) {
+    connecting = (async () => {
+      try {
+        client = new MongoClient(MONGODB_URI, {
+          serverSelectionTimeoutMS: 5000, // Fail fast instead of the 30s default
+          socketTimeoutMS: 45000,
+          connectTimeoutMS: 5000,
+        })
+        await client.connect()
+        db = client.db(DB_NAME)
+        console.log('✅ Connected to MongoDB')
+        return db
+      } catch (err) {
+        console.error('❌ MongoDB connection error:', err)
+        client = null
+        throw err
+      } finally {
+        connecting = null
+      }
+    })()
   }
+  return connecting
 }
 
 export async function getDB() {
@@ -31,6 +46,13 @@ export async function getDB() {
   return db
 }
 
+export async function getClient() {
+  if (!client || !db) {
+    await connectDB()
+  }
+  return client
+}
+
 export async function closeDB() {
   if (client) {
     await client.close()
@@ -39,4 +61,3 @@ export async function closeDB() {
     console.log('MongoDB connection closed')
   }
 }
-
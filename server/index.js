@@ -1,5 +1,6 @@
 import express from 'express'
 import cors from 'cors'
+import compression from 'compression'
 import dotenv from 'dotenv'
 import session from 'express-session'
 import MongoStore from 'connect-mongo'
@@ -7,9 +8,13 @@ import passport from 'passport'
 import { Strategy as GoogleStrategy } from 'passport-google-oauth20'
 import OpenAI from 'openai'
 import { ObjectId } from 'mongodb'
-import { connectDB, getDB } from './db.js'
+import { connectDB, getClient, getDB } from './db.js'
+import { createLimiter, QueueFullError } from './limiter.js'
 import cookieParser from 'cookie-parser'
 import { sign } from 'cookie-signature'
+import { Readable, Transform } from 'node:stream'
+import { pipeline } from 'node:stream/promises'
+import { createHash } from 'node:crypto'
 
 dotenv.config()
 
@@ -27,30 +32,37 @@ app.use(
 )
 
 app.use(express.json({ limit: '2mb' }))
+
+// Compress larger JSON responses (generated plans, sections and tests are often
+// tens of KB of text). Speech is already-compressed MP3 that is streamed to the
+// client as it arrives, so it is left alone. On Vercel the platform compresses
+// responses itself.
+if (!process.env.VERCEL) {
+  app.use(
+    compression({
+      threshold: 1024,
+      filter: (req, res) => !String(res.getHeader('Content-Type') || '').startsWith('audio/') && compression.filter(req, res),
+    }),
+  )
+}
 app.use(cookieParser())
 
 // Session configuration with MongoDB store (required for serverless/Vercel)
 const isProduction = process.env.NODE_ENV === 'production' || process.env.VERCEL === '1'
-const MONGODB_URI = process.env.MONGODB_URI || 'mongodb://localhost:27017/studyhub'
 
 // Create MongoDB session store with error handling and connection options
 let mongoStore
 try {
   mongoStore = MongoStore.create({
-    mongoUrl: MONGODB_URI,
+    // Reuse the app's MongoClient so sessions and data share one connection pool
+    // rather than paying a separate TCP/TLS handshake per serverless instance
+    clientPromise: getClient(),
     dbName: 'studyhub',
     collectionName: 'sessions',
     ttl: 30 * 24 * 60 * 60, // 30 days in seconds
     autoRemove: 'native',
     touchAfter: 24 * 3600, // Lazy session update
     stringify: false,
-    // Connection options for serverless
-    clientOptions: {
-      serverSelectionTimeoutMS: 5000, // Timeout after 5s instead of 30s
-      socketTimeoutMS: 45000,
-      connectTimeoutMS: 5000,
-      maxPoolSize: 1, // Limit connections for serverless
-    },
   })
   
   // Handle store errors gracefully
@@ -176,7 +188,11 @@ passport.deserializeUser(async (id, done) => {
       throw new Error('Database connection not available')
     }
     const usersCollection = db.collection('users')
-    const user = await usersCollection.findOne({ _id: new ObjectId(id) })
+    // Lectures are loaded by the lecture endpoints on demand, not on every request
+    const user = await usersCollection.findOne(
+      { _id: new ObjectId(id) },
+      { projection: { lectures: 0 } },
+    )
     done(null, user)
   } catch (err) {
     console.error('Error deserializing user:', err)
@@ -198,6 +214,17 @@ if (!openaiApiKey) {
 
 const openai = new OpenAI({ apiKey: openaiApiKey })
 
+// Bound concurrent upstream calls so bursts queue here instead of fanning out
+// into provider rate limits (429s) and retry-inflated tail latency
+const openaiLimiter = createLimiter(Number.parseInt(process.env.OPENAI_CONCURRENCY || '16', 10) || 16)
+const ttsLimiter = createLimiter(
+  Number.parseInt(process.env.ELEVENLABS_CONCURRENCY || '8', 10) || 8,
+  { maxQueue: 32 },
+)
+
+const createChatCompletion = (params) =>
+  openaiLimiter.run(() => openai.chat.completions.create(params))
+
 // Middleware to check authentication
 const requireAuth = (req, res, next) => {
   if (req.isAuthenticated()) {
@@ -353,26 +380,36 @@ app.post('/api/lectures/save', requireAuth, async (req, res) => {
     const db = await getDB()
     const usersCollection = db.collection('users')
 
-    const user = await usersCollection.findOne({ _id: req.user._id })
-    if (!user) {
-      return res.status(404).json({ error: 'User not found' })
-    }
-
-    // Update or add lecture
-    const lectures = user.lectures || []
-    const existingIndex = lectures.findIndex((l) => l.id === lecture.id)
-
-    if (existingIndex >= 0) {
-      lectures[existingIndex] = { ...lecture, updatedAt: new Date() }
-    } else {
-      lectures.push({ ...lecture, createdAt: new Date(), updatedAt: new Date() })
+    // Update the lecture in place if it exists, otherwise append it, without
+    // reading and rewriting the user's whole lectures array
+    const now = new Date()
+    const updateExisting = () =>
+      usersCollection.updateOne(
+        { _id: req.user._id, 'lectures.id': lecture.id },
+        { $set: { 'lectures.$': { ...lecture, updatedAt: now }, lastActivity: now } },
+      )
+
+    const updated = await updateExisting()
+    if (updated.matchedCount === 0) {
+      // Only push if no lecture with this id exists, so overlapping saves of a new
+      // lecture (autosave, StrictMode double updaters) cannot create duplicates
+      const inserted = await usersCollection.updateOne(
+        { _id: req.user._id, 'lectures.id': { $ne: lecture.id } },
+        {
+          $push: { lectures: { ...lecture, createdAt: now, updatedAt: now } },
+          $set: { lastActivity: now },
+        },
+      )
+
+      if (inserted.matchedCount === 0) {
+        // A concurrent save added the lecture first - apply this one as an update
+        const retried = await updateExisting()
+        if (retried.matchedCount === 0) {
+          return res.status(404).json({ error: 'User not found' })
+        }
+      }
     }
 
-    await usersCollection.updateOne(
-      { _id: req.user._id },
-      { $set: { lectures, lastActivity: new Date() } },
-    )
-
     res.json({ success: true })
   } catch (err) {
     console.error(err)
@@ -386,7 +423,10 @@ app.get('/api/lectures', requireAuth, async (req, res) => {
     const db = await getDB()
     const usersCollection = db.collection('users')
 
-    const user = await usersCollection.findOne({ _id: req.user._id })
+    const user = await usersCollection.findOne(
+      { _id: req.user._id },
+      { projection: { lectures: 1 } },
+    )
     if (!user) {
       return res.status(404).json({ error: 'User not found' })
     }
@@ -405,17 +445,13 @@ app.delete('/api/lectures/:lectureId', requireAuth, async (req, res) => {
     const db = await getDB()
     const usersCollection = db.collection('users')
 
-    const user = await usersCollection.findOne({ _id: req.user._id })
-    if (!user) {
-      return res.status(404).json({ error: 'User not found' })
-    }
-
-    const lectures = (user.lectures || []).filter((l) => l.id !== lectureId)
-
-    await usersCollection.updateOne(
+    const result = await usersCollection.updateOne(
       { _id: req.user._id },
-      { $set: { lectures, lastActivity: new Date() } },
+      { $pull: { lectures: { id: lectureId } }, $set: { lastActivity: new Date() } },
     )
+    if (result.matchedCount === 0) {
+      return res.status(404).json({ error: 'User not found' })
+    }
 
     res.json({ success: true })
   } catch (err) {
@@ -424,6 +460,21 @@ app.delete('/api/lectures/:lectureId', requireAuth, async (req, res) => {
   }
 })
 
+// Interview Practice chapter appended to every plan. It never varies, so it is
+// built once here rather than on each request. Frozen because the same objects
+// are shared by every response.
+const INTERVIEW_CONCEPTS = Object.freeze(['Case Study Analysis', 'Quantitative Problem Solving', 'Structured Thinking', 'Professional Communication'])
+const INTERVIEW_CHAPTER = Object.freeze({
+  id: 'interview-practice',
+  title: 'Interview Practice',
+  subchapters: Object.freeze([Object.freeze({
+    id: 'case-interview-practice',
+    title: 'Case Study Interview Simulation',
+    content: 'Practice your consulting case interview skills with our AI-powered interview simulator. This interactive session will guide you through a real McKinsey-style case study with voice interaction and real-time feedback.',
+    conceptOutline: INTERVIEW_CONCEPTS
+  })])
+})
+
 app.post('/api/plan', async (req, res) => {
   const { topic, goal, materialsSummary } = req.body || {}
 
@@ -508,7 +559,7 @@ EXAMPLE for "case study interview prep":
 Generate a comprehensive, well-coordinated plan without concept duplication.
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -525,26 +576,14 @@ Generate a comprehensive, well-coordinated plan without concept duplication.
 
     const parsed = JSON.parse(content)
     
-    // Always add Interview Practice as the final chapter
-    const interviewChapter = {
-      id: 'interview-practice',
-      title: 'Interview Practice',
-      subchapters: [{
-        id: 'case-interview-practice',
-        title: 'Case Study Interview Simulation',
-        content: 'Practice your consulting case interview skills with our AI-powered interview simulator. This interactive session will guide you through a real McKinsey-style case study with voice interaction and real-time feedback.',
-        conceptOutline: ['Case Study Analysis', 'Quantitative Problem Solving', 'Structured Thinking', 'Professional Communication']
-      }]
-    }
-    
     // Add to concept map
     if (parsed.conceptMap) {
-      parsed.conceptMap.allConcepts.push('Case Study Analysis', 'Quantitative Problem Solving', 'Structured Thinking', 'Professional Communication')
-      parsed.conceptMap.chapterDistribution['interview-practice'] = ['Case Study Analysis', 'Quantitative Problem Solving', 'Structured Thinking', 'Professional Communication']
+      parsed.conceptMap.allConcepts.push(...INTERVIEW_CONCEPTS)
+      parsed.conceptMap.chapterDistribution[INTERVIEW_CHAPTER.id] = INTERVIEW_CONCEPTS
     }
     
-    // Add the interview chapter
-    parsed.chapters.push(interviewChapter)
+    // Always add Interview Practice as the final chapter
+    parsed.chapters.push(INTERVIEW_CHAPTER)
     
     return res.json(parsed)
   } catch (err) {
@@ -598,7 +637,7 @@ CRITICAL REQUIREMENTS:
 - Questions should require applying knowledge, not just recalling facts.
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -784,7 +823,7 @@ CRITICAL FORMAT-SPECIFIC REQUIREMENTS:
 - QUALITY CHECK: Each section should pass the "does this teach something specific and actionable?" test
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -851,7 +890,7 @@ Requirements:
 - Order sections logically (foundational concepts first, then applications)
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -886,7 +925,7 @@ app.post('/api/learning-sections-enhancement', async (req, res) => {
 Subchapter Title: ${subchapterTitle}
 Goal: ${goal}
 Learning Sections (raw):
-${JSON.stringify(learningSections, null, 2)}
+${JSON.stringify(learningSections)}
 
 For each learning section, you must:
 1. CATEGORIZE it as one of: "process", "framework", "method", "definition", "concept", "comparison"
@@ -937,7 +976,7 @@ Return JSON:
 CRITICAL: Only include "process", "components", or "comparisonPoints" if the format requires it. Not all sections need processes!
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -958,6 +997,9 @@ CRITICAL: Only include "process", "components", or "comparisonPoints" if the for
   }
 })
 
+// Cap on how many earlier learning sections are included in exercise prompts
+const MAX_PREVIOUS_SECTIONS_IN_PROMPT = 6
+
 // New endpoint: Generate exercise on-demand for a learning section
 app.post('/api/generate-section-exercise', async (req, res) => {
   const { learningSection, previousSections, goal } = req.body || {}
@@ -970,8 +1012,13 @@ app.post('/api/generate-section-exercise', async (req, res) => {
     const system =
       'You are an expert tutor. Generate a single exercise that tests understanding of the learning section. The exercise must ONLY test material from the current section and previous sections shown above it.'
 
-    const previousSectionsText = previousSections && Array.isArray(previousSections) && previousSections.length > 0
-      ? '\n\nPrevious Sections (material already shown to user):\n' + previousSections.map((s, idx) => 
+    // Only the most recent sections are sent verbatim so the prompt stays a constant
+    // size instead of growing with every section the user has read
+    const recentSections = Array.isArray(previousSections)
+      ? previousSections.slice(-MAX_PREVIOUS_SECTIONS_IN_PROMPT)
+      : []
+    const previousSectionsText = recentSections.length > 0
+      ? '\n\nPrevious Sections (material already shown to user):\n' + recentSections.map((s, idx) => 
           `${idx + 1}. ${s.title}\n${s.content.explanation || ''}${s.content.process ? '\nProcess: ' + s.content.process.join(', ') : ''}`
         ).join('\n\n')
       : ''
@@ -983,7 +1030,7 @@ ${previousSectionsText}
 Current Learning Section:
 Title: ${learningSection.title}
 Format: ${learningSection.format}
-Content: ${JSON.stringify(learningSection.content, null, 2)}
+Content: ${JSON.stringify(learningSection.content)}
 
 Generate ONE exercise that:
 1. Tests understanding of the current section
@@ -1007,7 +1054,7 @@ Return JSON:
 CRITICAL: The exercise must be answerable using ONLY the current section and previous sections. Never reference material not yet shown.
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1044,7 +1091,7 @@ app.post('/api/generate-gap-material', async (req, res) => {
 Goal: ${goal}
 Learning Section: ${learningSection.title}
 Format: ${learningSection.format}
-Section Content: ${JSON.stringify(learningSection.content, null, 2)}
+Section Content: ${JSON.stringify(learningSection.content)}
 
 Knowledge Gap Identified:
 ${knowledgeGap}
@@ -1057,7 +1104,7 @@ Return JSON:
 }
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1094,12 +1141,12 @@ app.post('/api/exercise-follow-up', async (req, res) => {
 Goal: ${goal}
 Learning Section: ${learningSection.title}
 Format: ${learningSection.format}
-Section Content: ${JSON.stringify(learningSection.content, null, 2)}
+Section Content: ${JSON.stringify(learningSection.content)}
 
 Exercise:
 Prompt: ${exercise.prompt}
 ${exercise.exampleScenario ? `Scenario: ${exercise.exampleScenario}` : ''}
-${exercise.options ? `Options: ${JSON.stringify(exercise.options, null, 2)}` : ''}
+${exercise.options ? `Options: ${JSON.stringify(exercise.options)}` : ''}
 
 Student's Follow-up Question:
 ${followUpQuestion}
@@ -1126,7 +1173,7 @@ Return JSON:
 }
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1176,7 +1223,7 @@ Return JSON:
 }
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1213,10 +1260,10 @@ app.post('/api/practice-exercise-refine', async (req, res) => {
 Goal: ${goal}
 Learning Section: ${learningSection.title}
 Format: ${learningSection.format}
-Content: ${JSON.stringify(learningSection.content, null, 2)}
+Content: ${JSON.stringify(learningSection.content)}
 
 Current Practice Exercises:
-${JSON.stringify(exercises, null, 2)}
+${JSON.stringify(exercises)}
 
 Rewrite each exercise so it can be completed with specific, real details instead of abstract explanations. For each exercise:
 
@@ -1239,7 +1286,7 @@ Return JSON:
 CRITICAL: Make exercises answerable with specific details. Add concrete context, numbers, names, or structured guidance as needed.
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1275,7 +1322,7 @@ app.post('/api/practice-exercise-evaluate', async (req, res) => {
 Goal: ${goal}
 Learning Section: ${learningSection.title}
 Format: ${learningSection.format}
-Content: ${JSON.stringify(learningSection.content, null, 2)}
+Content: ${JSON.stringify(learningSection.content)}
 
 Practice Exercise:
 Prompt: ${exercise.prompt}
@@ -1298,7 +1345,7 @@ Return JSON:
 }
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1336,7 +1383,7 @@ Subchapter content:
 ${subchapterContent}
 
 Exercise:
-${JSON.stringify(exercise, null, 2)}
+${JSON.stringify(exercise)}
 
 User answer:
 ${userAnswer}
@@ -1351,7 +1398,7 @@ Return JSON:
 }
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1437,7 +1484,7 @@ Example for case interview training lecture:
 - Market Sizing Structuring (if chapter covers market sizing) (medium importance)
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1482,7 +1529,7 @@ ${lectureContent.chapters.map(ch =>
 
     const user = `
 Learning Goal: ${goal}
-Skills to Assess: ${JSON.stringify(skills, null, 2)}${lectureContext}
+Skills to Assess: ${JSON.stringify(skills)}${lectureContext}
 
 Using the detailed lecture content above, generate exactly 4 specific, actionable assessment questions per skill.
 
@@ -1532,7 +1579,7 @@ Example for SWOT Analysis skill (if covered in lecture):
 - "Do you know how to prioritize SWOT factors by impact and likelihood?" (advanced)
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1553,6 +1600,9 @@ Example for SWOT Analysis skill (if covered in lecture):
   }
 })
 
+// Cap on how many exercise attempts are included in chapter test prompts
+const MAX_EXERCISE_HISTORY_IN_PROMPT = 20
+
 // New endpoint: Generate comprehensive chapter test
 app.post('/api/generate-chapter-test', async (req, res) => {
   const { 
@@ -1580,9 +1630,13 @@ ADAPTIVE TEST STRATEGY:
 - Weight difficulty and question count based on knowledge gaps`
       : ''
 
-    const exerciseHistoryContext = userExerciseHistory && userExerciseHistory.length > 0
+    // Keep only the latest attempts so the prompt doesn't grow with the whole lecture
+    const recentExerciseHistory = Array.isArray(userExerciseHistory)
+      ? userExerciseHistory.slice(-MAX_EXERCISE_HISTORY_IN_PROMPT)
+      : []
+    const exerciseHistoryContext = recentExerciseHistory.length > 0
       ? `\n\nUser Exercise Performance History:
-${userExerciseHistory.map(ex => `- ${ex.sectionTitle}: ${ex.success ? 'Success' : 'Struggled'} (Score: ${ex.score || 'N/A'})`).join('\n')}
+${recentExerciseHistory.map(ex => `- ${ex.sectionTitle}: ${ex.success ? 'Success' : 'Struggled'} (Score: ${ex.score || 'N/A'})`).join('\n')}
 
 PERFORMANCE-BASED FOCUS:
 - Generate more questions for topics where user struggled
@@ -1665,7 +1719,7 @@ Return JSON:
 CRITICAL: Scenarios must be realistic, detailed, and provide sufficient information for thorough analysis. Each question should test practical application, not just memorization.
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1801,7 +1855,7 @@ CRITICAL EVALUATION PRINCIPLES:
 - Focus on growth and improvement
 `
 
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion({
       model: 'gpt-4o-mini',
       response_format: { type: 'json_object' },
       messages: [
@@ -1831,54 +1885,271 @@ CRITICAL EVALUATION PRINCIPLES:
   }
 })
 
-// ElevenLabs Text-to-Speech endpoint
-app.post('/api/text-to-speech', async (req, res) => {
+// Flash is ElevenLabs' lowest-latency model; 22.05kHz/32kbps MP3 is plenty for
+// speech and a quarter of the bytes of the default 44.1kHz/128kbps output
+const TTS_VOICE_ID = '21m00Tcm4TlvDq8ikWAM'
+const TTS_MODEL_ID = 'eleven_flash_v2_5'
+const TTS_OUTPUT_FORMAT = 'mp3_22050_32'
+// Interview prompts and spoken feedback are a few hundred characters; anything much
+// longer is not something the app asks for and would only burn synthesis credits
+const TTS_MAX_TEXT_LENGTH = 2000
+
+// In-memory LRU cache of synthesized speech keyed by text. Interview prompts are
+// fixed strings, so repeats are served without another ElevenLabs round-trip.
+// Entries also expire so one-off texts don't stay resident in long-lived processes.
+const TTS_CACHE_MAX_ENTRIES = 128
+const TTS_CACHE_LOCAL_TTL_MS = 60 * 60 * 1000 // 1 hour
+const ttsCache = new Map()
+
+function getCachedSpeech(text) {
+  const entry = ttsCache.get(text)
+  if (!entry) return undefined
+
+  ttsCache.delete(text)
+  if (entry.expiresAt <= Date.now()) return undefined
+
+  // Re-insert to mark as most recently used
+  ttsCache.set(text, entry)
+  return entry.audio
+}
+
+function cacheSpeech(text, audio) {
+  ttsCache.delete(text)
+  ttsCache.set(text, { audio, expiresAt: Date.now() + TTS_CACHE_LOCAL_TTL_MS })
+  if (ttsCache.size > TTS_CACHE_MAX_ENTRIES) {
+    ttsCache.delete(ttsCache.keys().next().value)
+  }
+}
+
+// Shared cache tier in MongoDB so every serverless instance can reuse audio that
+// any other instance already synthesized. Entries expire via a TTL index.
+const TTS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+let ttsCollectionPromise = null
+
+function getTtsCollection() {
+  if (!ttsCollectionPromise) {
+    ttsCollectionPromise = getDB()
+      .then(async (db) => {
+        const collection = db.collection('tts_cache')
+        await collection.createIndex({ createdAt: 1 }, { expireAfterSeconds: TTS_CACHE_TTL_SECONDS })
+        return collection
+      })
+      .catch((err) => {
+        ttsCollectionPromise = null
+        throw err
+      })
+  }
+  return ttsCollectionPromise
+}
+
+// Include the voice settings so audio from a previous model is not served back
+function speechCacheKey(text) {
+  return createHash('sha256')
+    .update(`${TTS_VOICE_ID}:${TTS_MODEL_ID}:${TTS_OUTPUT_FORMAT}:${text}`)
+    .digest('hex')
+}
+
+// The shared tier is an optimization, so a slow or unreachable MongoDB must not
+// hold up speech: lookups give up quickly and fall through to synthesis, and
+// writes are abandoned so the response can still end
+const TTS_CACHE_LOOKUP_TIMEOUT_MS = 500
+const TTS_CACHE_WRITE_TIMEOUT_MS = 1000
+
+function withTimeout(promise, ms, message) {
+  let timer
+  const timeout = new Promise((_resolve, reject) => {
+    timer = setTimeout(() => reject(new Error(message)), ms)
+  })
+  return Promise.race([promise, timeout]).finally(() => clearTimeout(timer))
+}
+
+async function loadSharedSpeech(text) {
   try {
-    const { text } = req.body
+    // maxTimeMS bounds the query on the server; the race also covers waiting for a connection
+    const doc = await withTimeout(
+      getTtsCollection().then((collection) =>
+        collection.findOne({ _id: speechCacheKey(text) }, { maxTimeMS: TTS_CACHE_LOOKUP_TIMEOUT_MS }),
+      ),
+      TTS_CACHE_LOOKUP_TIMEOUT_MS,
+      `TTS cache lookup timed out after ${TTS_CACHE_LOOKUP_TIMEOUT_MS}ms`,
+    )
+    if (!doc) return null
+
+    // Wrap the BSON binary's bytes as a Buffer view rather than copying them
+    const bytes = doc.audio.buffer
+    return Buffer.from(bytes.buffer, bytes.byteOffset, bytes.byteLength)
+  } catch (err) {
+    console.error('TTS cache lookup failed:', err)
+    return null
+  }
+}
+
+async function storeSharedSpeech(text, audio) {
+  try {
+    await withTimeout(
+      getTtsCollection().then((collection) =>
+        collection.updateOne(
+          { _id: speechCacheKey(text) },
+          { $set: { audio, createdAt: new Date() } },
+          { upsert: true },
+        ),
+      ),
+      TTS_CACHE_WRITE_TIMEOUT_MS,
+      `TTS cache write timed out after ${TTS_CACHE_WRITE_TIMEOUT_MS}ms`,
+    )
+  } catch (err) {
+    console.error('TTS cache write failed:', err)
+  }
+}
+
+// Lookup/synthesis currently in progress, keyed by text. Concurrent requests for
+// the same prompt (e.g. many students starting the interview at once) wait for
+// the first one instead of each triggering its own ElevenLabs call. Waiters get
+// the complete clip once synthesis finishes rather than a progressive stream.
+const inflightSpeech = new Map()
+
+// Audio for a given text never changes, so GET responses (keyed by URL) can be
+// served from the browser cache and Vercel's edge instead of reaching the API
+const TTS_GET_CACHE_CONTROL = 'public, max-age=86400, s-maxage=604800'
+
+function speechCacheControl(req) {
+  return req.method === 'GET' ? TTS_GET_CACHE_CONTROL : 'no-store'
+}
+
+function sendSpeech(res, audio, cacheControl) {
+  res.set({
+    'Content-Type': 'audio/mpeg',
+    'Content-Length': audio.length,
+    'Cache-Control': cacheControl
+  })
+  return res.send(audio)
+}
+
+// Stream ElevenLabs audio to the client and resolve with the complete MP3. The
+// response is left open so the caller can persist the audio before ending it.
+async function streamSpeech(text, res, cacheControl) {
+  const params = new URLSearchParams({
+    output_format: TTS_OUTPUT_FORMAT,
+    optimize_streaming_latency: '3',
+  })
+  const response = await fetch(`https://api.elevenlabs.io/v1/text-to-speech/${TTS_VOICE_ID}/stream?${params}`, {
+    method: 'POST',
+    headers: {
+      'Accept': 'audio/mpeg',
+      'Content-Type': 'application/json',
+      'xi-api-key': process.env.ELEVENLABS_API_KEY
+    },
+    body: JSON.stringify({
+      text: text,
+      model_id: TTS_MODEL_ID,
+      voice_settings: {
+        stability: 0.5,
+        similarity_boost: 0.5
+      }
+    })
+  })
+
+  if (!response.ok || !response.body) {
+    throw new Error(`ElevenLabs API error: ${response.status}`)
+  }
+
+  res.set({
+    'Content-Type': 'audio/mpeg',
+    'Cache-Control': cacheControl
+  })
+
+  // Pipe instead of buffering so the client receives the first chunk immediately,
+  // keeping a copy of each chunk to populate the cache once synthesis completes
+  const chunks = []
+  const recorder = new Transform({
+    transform(chunk, _encoding, callback) {
+      chunks.push(chunk)
+      callback(null, chunk)
+    }
+  })
+  await pipeline(Readable.fromWeb(response.body), recorder, res, { end: false })
+  return Buffer.concat(chunks)
+}
+
+// ElevenLabs Text-to-Speech endpoint. GET lets an <audio> element play the
+// response progressively while it is still being synthesized.
+const textToSpeech = async (req, res) => {
+  try {
+    const text = req.method === 'GET' ? req.query.text : req.body?.text
     
-    if (!text) {
+    if (!text || typeof text !== 'string') {
       return res.status(400).json({ error: 'Text is required' })
     }
 
-    if (!process.env.ELEVENLABS_API_KEY) {
-      return res.status(500).json({ error: 'ElevenLabs API key not configured' })
+    if (text.length > TTS_MAX_TEXT_LENGTH) {
+      return res.status(400).json({ error: `Text must be at most ${TTS_MAX_TEXT_LENGTH} characters` })
     }
 
-    // ElevenLabs API call
-    const response = await fetch('https://api.elevenlabs.io/v1/text-to-speech/21m00Tcm4TlvDq8ikWAM', {
-      method: 'POST',
-      headers: {
-        'Accept': 'audio/mpeg',
-        'Content-Type': 'application/json',
-        'xi-api-key': process.env.ELEVENLABS_API_KEY
-      },
-      body: JSON.stringify({
-        text: text,
-        model_id: 'eleven_monolingual_v1',
-        voice_settings: {
-          stability: 0.5,
-          similarity_boost: 0.5
-        }
-      })
-    })
+    const cachedAudio = getCachedSpeech(text)
+    if (cachedAudio) {
+      return sendSpeech(res, cachedAudio, speechCacheControl(req))
+    }
 
-    if (!response.ok) {
-      throw new Error(`ElevenLabs API error: ${response.status}`)
+    // Wait for a request that is already looking up or synthesizing this text.
+    // If it fails, the first waiter to resume takes over as the owner.
+    let inflight
+    while ((inflight = inflightSpeech.get(text))) {
+      const sharedAudio = await inflight
+      if (sharedAudio) {
+        return sendSpeech(res, sharedAudio, speechCacheControl(req))
+      }
     }
 
-    const audioBuffer = await response.arrayBuffer()
-    
-    res.set({
-      'Content-Type': 'audio/mpeg',
-      'Content-Length': audioBuffer.byteLength
-    })
-    
-    res.send(Buffer.from(audioBuffer))
+    // Registered before the shared-cache lookup so requests arriving during the
+    // lookup or synthesis wait on this one instead of calling ElevenLabs
+    let audio = null
+    let settleInflight
+    const pending = new Promise((resolve) => { settleInflight = resolve })
+    inflightSpeech.set(text, pending)
+    try {
+      audio = await loadSharedSpeech(text)
+      if (audio) {
+        cacheSpeech(text, audio)
+        return sendSpeech(res, audio, speechCacheControl(req))
+      }
+
+      if (!process.env.ELEVENLABS_API_KEY) {
+        return res.status(500).json({ error: 'ElevenLabs API key not configured' })
+      }
+
+      // ElevenLabs streaming API call - audio chunks are forwarded as they arrive.
+      // The slot is held for the whole stream, matching how ElevenLabs counts concurrency
+      audio = await ttsLimiter.run(() => streamSpeech(text, res, speechCacheControl(req)))
+      cacheSpeech(text, audio)
+    } finally {
+      if (inflightSpeech.get(text) === pending) inflightSpeech.delete(text)
+      settleInflight(audio)
+    }
+
+    // Persist before ending the response: on Vercel, work after the response is
+    // sent is not guaranteed to run
+    await storeSharedSpeech(text, audio)
+    res.end()
   } catch (error) {
+    if (error instanceof QueueFullError) {
+      res.set('Retry-After', '2')
+      return res.status(503).json({ error: 'Speech service is busy, please retry' })
+    }
     console.error('Text-to-speech error:', error)
+    if (res.headersSent) {
+      res.destroy(error)
+      return
+    }
     res.status(500).json({ error: 'Failed to generate speech' })
   }
-})
+}
+
+// Synthesis costs ElevenLabs credits, so only signed-in users may request it. The GET
+// form is a simple cross-origin request that CORS does not block, so it needs the
+// check as much as POST does. Responses already cached at the edge are served
+// without reaching this handler, which costs nothing.
+app.get('/api/text-to-speech', requireAuth, textToSpeech)
+app.post('/api/text-to-speech', requireAuth, textToSpeech)
 
 app.get('/health', (_req, res) => {
   res.json({ ok: true })
@@ -1893,4 +2164,3 @@ if (!process.env.VERCEL) {
     console.log(`StudyHub API listening on http://localhost:${PORT}`)
   })
 }
-
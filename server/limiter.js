@@ -0,0 +1,43 @@
+// Counting semaphore used to cap concurrent calls to an external API.
+// Callers beyond the limit wait in FIFO order; when maxQueue is set, callers
+// beyond that are rejected so clients can retry instead of piling up.
+export class QueueFullError extends Error {
+  constructor(message = 'Too many requests queued') {
+    super(message)
+    this.name = 'QueueFullError'
+  }
+}
+
+export function createLimiter(maxConcurrent, { maxQueue = Infinity } = {}) {
+  let active = 0
+  const waiting = []
+
+  const release = () => {
+    const next = waiting.shift()
+    if (next) {
+      // Hand the slot straight to the next waiter
+      next()
+    } else {
+      active--
+    }
+  }
+
+  return {
+    async run(task) {
+      if (active < maxConcurrent) {
+        active++
+      } else {
+        if (waiting.length >= maxQueue) {
+          throw new QueueFullError()
+        }
+        await new Promise((resolve) => waiting.push(resolve))
+      }
+
+      try {
+        return await task()
+      } finally {
+        release()
+      }
+    },
+  }
+}
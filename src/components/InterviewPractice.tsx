@@ -65,29 +65,13 @@ interface InterviewQuestion {
   followUps: string[]
 }
 
-export function InterviewPractice({ onComplete }: InterviewPracticeProps) {
-  // Phase management
-  const [currentPhase, setCurrentPhase] = useState<InterviewPhase>('ready')
-  const [readingTimeLeft, setReadingTimeLeft] = useState(300) // 5 minutes in seconds
-  
-  // Interview state
-  const [currentQuestionIndex, setCurrentQuestionIndex] = useState(0)
-  const [userResponses, setUserResponses] = useState<string[]>([])
-  const [feedback, setFeedback] = useState<string[]>([])
-  const [interviewComplete, setInterviewComplete] = useState(false)
-  const [score, setScore] = useState<number>(0)
-  
-  // Voice functionality state
-  const [isRecording, setIsRecording] = useState(false)
-  const [isAISpeaking, setIsAISpeaking] = useState(false)
-  const [conversationHistory, setConversationHistory] = useState<Array<{role: 'ai' | 'user', text: string, timestamp: Date}>>([])
-  const [currentAudio, setCurrentAudio] = useState<HTMLAudioElement | null>(null)
+const API_BASE = import.meta.env.PROD 
+  ? '' 
+  : (import.meta.env.VITE_API_BASE_URL || 'http://localhost:8787')
 
-  const readingTimerRef = useRef<ReturnType<typeof setInterval> | null>(null)
-  const speechRecognitionRef = useRef<SpeechRecognition | null>(null)
-
-  // Clean case study content (without Questions 1, 2, 3)
-  const CASE_STUDY_CONTENT = `**Client Goal**
+// Interview content is static, so it is defined once here instead of on every render.
+// Clean case study content (without Questions 1, 2, 3)
+const CASE_STUDY_CONTENT = `**Client Goal**
 Our client is Beautify. Beautify has approached McKinsey for help with exploring new ways to approach its customers.
 
 **Situation Description**
@@ -110,27 +94,61 @@ Beautify's president and COO engaged McKinsey to help evaluate if training the m
 • Write down important information.
 • Feel free to ask the interviewer to explain anything that is not clear to you.`
 
-  // Interview questions with evaluation criteria
-  const INTERVIEW_QUESTIONS: InterviewQuestion[] = [
-    {
-      id: 'strategy',
-      question: 'Beautify is excited to support its current staff of beauty consultants on the journey to becoming virtual social media-beauty advisors. Consultants would still lead the way in terms of direct consumer engagement and would be expected to maintain and grow a group of clients. They would sell products through their own pages on beautify.com, make appearances at major retail outlets, and be active on all social media platforms. What possible factors should Beautify consider when shifting this group of employees toward a new set of responsibilities?',
-      keyPoints: ['retailer response', 'competitor analysis', 'current capabilities', 'brand image', 'training needs', 'technology requirements', 'compensation structure', 'change management'],
-      followUps: ['Can you elaborate on the retailer partnerships?', 'What specific training would be most critical?', 'How might competitors respond to this strategy?']
-    },
-    {
-      id: 'customer',
-      question: 'One of the key areas that Beautify wants to understand is the reaction of current and potential new customers to the virtual social media-beauty advisors. Imagine you are a current Beautify customer and you mostly shop at your local department store because you enjoy the high-touch service offered by in-store consultants. What features would make you consider switching to a mostly virtual sales experience?',
-      keyPoints: ['real-time feedback', 'social community', 'personalized recommendations', 'trend insights', 'private consultation', 'mobile app features', 'virtual try-on', 'convenience factors'],
-      followUps: ['How important is the personal relationship aspect?', 'What concerns might customers have about virtual consultations?', 'How could technology enhance the experience?']
-    },
-    {
-      id: 'financial',
-      question: 'The discussion about virtual advisors has been energizing, but I\'d like to ground this in some analysis. You sit down with your teammates from Beautify finance and come up with the following assumptions: With advisors, you expect a ten percent overall increase in incremental revenue in the first year. In that first year, Beautify will invest €50 million in IT, €25 million in training, €50 million in remodeling department store counters, and €25 million in inventory. Beautify expects a 5% annual depreciation of the upfront investment each year. All-in yearly costs associated with a shift to advisors are expected to be €10 million starting the first year. Beautify\'s revenues are €1.3 billion. How many years would it take until the investment turns profitable?',
-      keyPoints: ['incremental revenue calculation', 'upfront investment total', 'annual costs', 'depreciation calculation', 'payback period', 'net present value considerations'],
-      followUps: ['Can you walk me through your calculation step by step?', 'What assumptions might be risky in this analysis?', 'How would you test these assumptions?']
-    }
-  ]
+// Interview questions with evaluation criteria
+const INTERVIEW_QUESTIONS: InterviewQuestion[] = [
+  {
+    id: 'strategy',
+    question: 'Beautify is excited to support its current staff of beauty consultants on the journey to becoming virtual social media-beauty advisors. Consultants would still lead the way in terms of direct consumer engagement and would be expected to maintain and grow a group of clients. They would sell products through their own pages on beautify.com, make appearances at major retail outlets, and be active on all social media platforms. What possible factors should Beautify consider when shifting this group of employees toward a new set of responsibilities?',
+    keyPoints: ['retailer response', 'competitor analysis', 'current capabilities', 'brand image', 'training needs', 'technology requirements', 'compensation structure', 'change management'],
+    followUps: ['Can you elaborate on the retailer partnerships?', 'What specific training would be most critical?', 'How might competitors respond to this strategy?']
+  },
+  {
+    id: 'customer',
+    question: 'One of the key areas that Beautify wants to understand is the reaction of current and potential new customers to the virtual social media-beauty advisors. Imagine you are a current Beautify customer and you mostly shop at your local department store because you enjoy the high-touch service offered by in-store consultants. What features would make you consider switching to a mostly virtual sales experience?',
+    keyPoints: ['real-time feedback', 'social community', 'personalized recommendations', 'trend insights', 'private consultation', 'mobile app features', 'virtual try-on', 'convenience factors'],
+    followUps: ['How important is the personal relationship aspect?', 'What concerns might customers have about virtual consultations?', 'How could technology enhance the experience?']
+  },
+  {
+    id: 'financial',
+    question: 'The discussion about virtual advisors has been energizing, but I\'d like to ground this in some analysis. You sit down with your teammates from Beautify finance and come up with the following assumptions: With advisors, you expect a ten percent overall increase in incremental revenue in the first year. In that first year, Beautify will invest €50 million in IT, €25 million in training, €50 million in remodeling department store counters, and €25 million in inventory. Beautify expects a 5% annual depreciation of the upfront investment each year. All-in yearly costs associated with a shift to advisors are expected to be €10 million starting the first year. Beautify\'s revenues are €1.3 billion. How many years would it take until the investment turns profitable?',
+    keyPoints: ['incremental revenue calculation', 'upfront investment total', 'annual costs', 'depreciation calculation', 'payback period', 'net present value considerations'],
+    followUps: ['Can you walk me through your calculation step by step?', 'What assumptions might be risky in this analysis?', 'How would you test these assumptions?']
+  }
+]
+
+const INTRO_TEXT = "Hello! I'm your AI interviewer. I'll be conducting a case interview with you today using the Beautify case study. Let's begin with our first question."
+
+const CLOSING_MESSAGE = "That concludes our interview. Thank you for your responses. You can review your performance and try again if you'd like."
+
+// Prompt the interviewer speaks after the candidate answers each question
+const FOLLOW_UP_TEXTS = INTERVIEW_QUESTIONS.map((_, index) =>
+  index < INTERVIEW_QUESTIONS.length - 1
+    ? `Now, let's move to the next question. ${INTERVIEW_QUESTIONS[index + 1].question}`
+    : CLOSING_MESSAGE
+)
+
+export function InterviewPractice({ onComplete }: InterviewPracticeProps) {
+  // Phase management
+  const [currentPhase, setCurrentPhase] = useState<InterviewPhase>('ready')
+  const [readingTimeLeft, setReadingTimeLeft] = useState(300) // 5 minutes in seconds
+  
+  // Interview state
+  const [currentQuestionIndex, setCurrentQuestionIndex] = useState(0)
+  const [userResponses, setUserResponses] = useState<string[]>([])
+  const [feedback, setFeedback] = useState<string[]>([])
+  const [interviewComplete, setInterviewComplete] = useState(false)
+  const [score, setScore] = useState<number>(0)
+  
+  // Voice functionality state
+  const [isRecording, setIsRecording] = useState(false)
+  const [isAISpeaking, setIsAISpeaking] = useState(false)
+  const [conversationHistory, setConversationHistory] = useState<Array<{role: 'ai' | 'user', text: string, timestamp: Date}>>([])
+
+  const readingTimerRef = useRef<ReturnType<typeof setInterval> | null>(null)
+  const speechRecognitionRef = useRef<SpeechRecognition | null>(null)
+  const prefetchedSpeechRef = useRef<{ text: string; audio: Promise<Blob> } | null>(null)
+  // Kept in a ref so a new clip can always stop the one playing, even from stale closures
+  const currentAudioRef = useRef<HTMLAudioElement | null>(null)
 
   const startReadingTimer = () => {
     if (readingTimerRef.current) {
@@ -186,25 +204,29 @@ Beautify's president and COO engaged McKinsey to help evaluate if training the m
     }
 
     // AI introduces the interview - display first, then speak
-    const introText = "Hello! I'm your AI interviewer. I'll be conducting a case interview with you today using the Beautify case study. Let's begin with our first question."
-    const introMessage = { role: 'ai' as const, text: introText, timestamp: new Date() }
+    const introMessage = { role: 'ai' as const, text: INTRO_TEXT, timestamp: new Date() }
     setConversationHistory([introMessage])
+
+    // Synthesize the first question while the intro is streaming
+    const firstQuestion = INTERVIEW_QUESTIONS[0]
+    const firstQuestionAudio = fetchSpeech(firstQuestion.question)
+    firstQuestionAudio.catch(() => {}) // Handled when awaited by speakText
     
     // Wait for UI to update, then speak intro
     setTimeout(async () => {
       try {
-        await speakText(introText)
+        await speakText(INTRO_TEXT)
         
         // After intro finishes speaking, show and ask the first question
         setTimeout(async () => {
-          const firstQuestion = INTERVIEW_QUESTIONS[0]
           const questionMessage = { role: 'ai' as const, text: firstQuestion.question, timestamp: new Date() }
           setConversationHistory(prev => [...prev, questionMessage])
           
           // Wait for UI update, then speak the question
           setTimeout(async () => {
             try {
-              await speakText(firstQuestion.question)
+              prefetchSpeech(FOLLOW_UP_TEXTS[0])
+              await speakText(firstQuestion.question, firstQuestionAudio)
             } catch (error) {
               console.warn('Auto-play blocked for question:', error)
             }
@@ -214,7 +236,6 @@ Beautify's president and COO engaged McKinsey to help evaluate if training the m
         console.warn('Auto-play blocked for intro, showing first question anyway:', error)
         // If speech fails, still show the first question
         setTimeout(() => {
-          const firstQuestion = INTERVIEW_QUESTIONS[0]
           const questionMessage = { role: 'ai' as const, text: firstQuestion.question, timestamp: new Date() }
           setConversationHistory(prev => [...prev, questionMessage])
         }, 2000)
@@ -309,35 +330,38 @@ Beautify's president and COO engaged McKinsey to help evaluate if training the m
     const aiMessage = { role: 'ai' as const, text: aiResponse, timestamp: new Date() }
     setConversationHistory(prev => [...prev, aiMessage])
 
+    // The follow-up prompt was usually prefetched while the candidate was answering
+    const hasNextQuestion = currentQuestionIndex < INTERVIEW_QUESTIONS.length - 1
+    const followUpText = FOLLOW_UP_TEXTS[currentQuestionIndex]
+    const followUpAudio = takePrefetchedSpeech(followUpText)
+
     // Wait a moment for UI to update, then speak the feedback
     setTimeout(async () => {
       await speakText(aiResponse)
       
       // After speaking feedback, move to next question or complete interview
-      if (currentQuestionIndex < INTERVIEW_QUESTIONS.length - 1) {
+      if (hasNextQuestion) {
         setCurrentQuestionIndex(prev => prev + 1)
         
         // Ask the next question - display first, then speak
         setTimeout(async () => {
-          const nextQuestion = INTERVIEW_QUESTIONS[currentQuestionIndex + 1]
-          const questionText = `Now, let's move to the next question. ${nextQuestion.question}`
-          const questionMessage = { role: 'ai' as const, text: questionText, timestamp: new Date() }
+          const questionMessage = { role: 'ai' as const, text: followUpText, timestamp: new Date() }
           setConversationHistory(prev => [...prev, questionMessage])
           
           // Wait for UI update, then speak
           setTimeout(async () => {
-            await speakText(questionText)
+            prefetchSpeech(FOLLOW_UP_TEXTS[currentQuestionIndex + 1])
+            await speakText(followUpText, followUpAudio)
           }, 500)
         }, 1000)
       } else {
         // Interview complete - display final message first, then speak
         setTimeout(async () => {
-          const finalMessage = "That concludes our interview. Thank you for your responses. You can review your performance and try again if you'd like."
-          const finalAiMessage = { role: 'ai' as const, text: finalMessage, timestamp: new Date() }
+          const finalAiMessage = { role: 'ai' as const, text: CLOSING_MESSAGE, timestamp: new Date() }
           setConversationHistory(prev => [...prev, finalAiMessage])
           
           setTimeout(async () => {
-            await speakText(finalMessage)
+            await speakText(CLOSING_MESSAGE, followUpAudio)
             setInterviewComplete(true)
           }, 500)
         }, 1000)
@@ -346,6 +370,8 @@ Beautify's president and COO engaged McKinsey to help evaluate if training the m
   }
 
   const restartInterview = () => {
+    prefetchedSpeechRef.current = null
+    currentAudioRef.current?.pause()
     setCurrentPhase('ready')
     setReadingTimeLeft(300)
     setCurrentQuestionIndex(0)
@@ -362,55 +388,100 @@ Beautify's president and COO engaged McKinsey to help evaluate if training the m
     return `${mins}:${secs.toString().padStart(2, '0')}`
   }
 
+  // Speech is requested with GET so repeated prompts are served from the HTTP cache
+  const speechUrl = (text: string): string =>
+    `${API_BASE}/api/text-to-speech?text=${encodeURIComponent(text)}`
+
+  // Fetch synthesized speech from ElevenLabs - can be started ahead of playback
+  const fetchSpeech = async (text: string): Promise<Blob> => {
+    const response = await fetch(speechUrl(text), { credentials: 'include' })
+
+    if (!response.ok) {
+      throw new Error('Failed to generate speech')
+    }
+
+    return response.blob()
+  }
+
+  // Speculatively synthesize the prompt that follows the candidate's answer so it
+  // is ready by the time they finish speaking
+  const prefetchSpeech = (text: string) => {
+    const audio = fetchSpeech(text)
+    audio.catch(() => {}) // Handled when awaited by speakText
+    prefetchedSpeechRef.current = { text, audio }
+  }
+
+  // Use the speculative audio if it is for this text, otherwise synthesize now
+  const takePrefetchedSpeech = (text: string): Promise<Blob> => {
+    const prefetched = prefetchedSpeechRef.current
+    prefetchedSpeechRef.current = null
+    if (prefetched?.text === text) return prefetched.audio
+
+    const audio = fetchSpeech(text)
+    audio.catch(() => {}) // Handled when awaited by speakText
+    return audio
+  }
+
+  // Play a clip through the shared audio element slot. Resolves once it has finished
+  // (or was stopped) so callers can sequence clips without them talking over each
+  // other; resolves false if the browser could not play it.
+  const playClip = (audio: HTMLAudioElement): Promise<boolean> => {
+    currentAudioRef.current = audio
+    return new Promise<boolean>((resolve) => {
+      audio.onended = () => resolve(true)
+      audio.onpause = () => resolve(true)
+      audio.onerror = () => resolve(false)
+      audio.play().catch(() => resolve(false))
+    })
+  }
+
+  const playBlob = async (blob: Blob): Promise<HTMLAudioElement> => {
+    const audioUrl = URL.createObjectURL(blob)
+    const audio = new Audio(audioUrl)
+    try {
+      if (!(await playClip(audio))) console.error('Audio playback failed')
+    } finally {
+      URL.revokeObjectURL(audioUrl)
+    }
+    return audio
+  }
+
   // Text-to-Speech using ElevenLabs
-  const speakText = async (text: string): Promise<void> => {
+  const speakText = async (text: string, pendingAudio?: Promise<Blob>): Promise<void> => {
+    let audio: HTMLAudioElement | null = null
     try {
       setIsAISpeaking(true)
       
       // Stop any currently playing audio
-      if (currentAudio) {
-        currentAudio.pause()
-        setCurrentAudio(null)
-      }
+      currentAudioRef.current?.pause()
+      currentAudioRef.current = null
 
-      const API_BASE = import.meta.env.PROD 
-        ? '' 
-        : (import.meta.env.VITE_API_BASE_URL || 'http://localhost:8787')
-
-      const response = await fetch(`${API_BASE}/api/text-to-speech`, {
-        method: 'POST',
-        headers: { 
-          'Content-Type': 'application/json',
-        },
-        credentials: 'include',
-        body: JSON.stringify({ text })
-      })
-
-      if (!response.ok) {
-        throw new Error('Failed to generate speech')
+      if (pendingAudio) {
+        // Reuse audio that was requested in parallel
+        audio = await playBlob(await pendingAudio)
+      } else {
+        // Point the audio element at the streaming endpoint so playback starts while
+        // synthesis is still running
+        audio = new Audio(speechUrl(text))
+        const played = await playClip(audio)
+
+        // The stream has no Content-Length or Range support, which some browsers
+        // (notably Safari) refuse to play; download the whole clip instead
+        if (!played && currentAudioRef.current === audio) {
+          console.warn('Streaming playback failed, falling back to the full clip')
+          audio = await playBlob(await fetchSpeech(text))
+        }
       }
-
-      const audioBlob = await response.blob()
-      const audioUrl = URL.createObjectURL(audioBlob)
-      const audio = new Audio(audioUrl)
-      
-      setCurrentAudio(audio)
-
-      audio.onended = () => {
+    } catch (error) {
+      console.error('Text-to-speech error:', error)
+    } finally {
+      // Leave the state alone if another clip has taken over in the meantime
+      if (!audio) {
         setIsAISpeaking(false)
-        URL.revokeObjectURL(audioUrl)
-        setCurrentAudio(null)
-      }
-
-      audio.onerror = () => {
+      } else if (currentAudioRef.current === audio) {
+        currentAudioRef.current = null
         setIsAISpeaking(false)
-        console.error('Audio playback failed')
       }
-
-      await audio.play()
-    } catch (error) {
-      console.error('Text-to-speech error:', error)
-      setIsAISpeaking(false)
     }
   }
 